@@ -1,4 +1,9 @@
+import re
 import warnings
+from abc import abstractmethod
+from collections import OrderedDict
+from functools import partial
+from time import monotonic
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -7,37 +12,131 @@ from typing import (
     Dict,
     List,
     Optional,
+    Pattern,
+    Tuple,
+    TypeVar,
     Union,
-    cast,
 )
 
-from pydantic import BaseModel, validator
+from pydantic import BaseConfig, BaseModel, Field, validator
 from pydantic_openapi_schema.v3_1_0 import (
     Components,
     SecurityRequirement,
     SecurityScheme,
 )
-from starlite.exceptions import NotAuthorizedException
+from starlite.enums import ScopeType
+from starlite.exceptions import ImproperlyConfiguredException, NotAuthorizedException
 from starlite.middleware import ExceptionHandlerMiddleware
-from starlite.middleware.authentication import (
-    AbstractAuthenticationMiddleware,
-    AuthenticationResult,
-)
 from starlite.middleware.base import DefineMiddleware, MiddlewareProtocol
-from starlite.middleware.session.base import BaseBackendConfig, SessionMiddleware
+from starlite.middleware.session.base import (
+    BaseBackendConfig,
+    BaseSessionBackend,
+    SessionMiddleware,
+)
 from starlite.middleware.session.cookie_backend import (
     CookieBackend,
     CookieBackendConfig,
 )
+from starlite.middleware.util import should_bypass_middleware
+from starlite.status_codes import HTTP_401_UNAUTHORIZED
 from starlite.types import Empty, SyncOrAsyncUnion
-from starlite.utils import AsyncCallable
+from starlite.utils import async_partial, create_exception_response, is_async_callable
+from starlite.utils.exception import get_exception_handler
 
 if TYPE_CHECKING:  # pragma: no cover
-    from starlite.connection import ASGIConnection
-    from starlite.middleware.session.base import BaseSessionBackend
     from starlite.types import ASGIApp, Receive, Scope, Send
+    from starlite.types.asgi_types import HTTPResponseBodyEvent, HTTPResponseStartEvent
 
 RetrieveUserHandler = Callable[[Dict[str, Any]], SyncOrAsyncUnion[Any]]
+ConfigT = TypeVar("ConfigT", bound="BaseSessionAuthConfig")
+
+NO_SESSION_DETAIL = "no session data found"
+NO_USER_DETAIL = "no user correlating to session found"
+
+
+class UserCache:
+    __slots__ = ("ttl", "maxsize", "key", "_data")
+
+    def __init__(self, ttl: float, maxsize: int, key: str = "id"):
+        """An in-process LRU cache with a time-to-live, mapping session
+        identifiers to 'user' values.
+
+        Args:
+            ttl: Number of seconds for which a cached user remains valid.
+            maxsize: The maximum number of cached users.
+            key: The key of the session value that identifies a cached user.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.key = key
+        self._data: "OrderedDict[Union[str, int], Tuple[float, Any]]" = OrderedDict()
+
+    def get_session_id(self, session: Dict[str, Any]) -> Optional[Union[str, int]]:
+        """Get the identifier of a cached user from the session.
+
+        Only string and integer values are used, sessions holding any other
+        value under 'key' are not cached.
+
+        Args:
+            session: The session dictionary.
+
+        Returns:
+            The session identifier, or `None` if the session cannot be cached.
+        """
+        value = session.get(self.key)
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            return value
+        return None
+
+    def get(self, key: Union[str, int]) -> Any:
+        """
+        Args:
+            key: A session identifier.
+
+        Returns:
+            The cached user, or `None` if it is missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at < monotonic():
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return user
+
+    def set(self, key: Union[str, int], user: Any) -> None:
+        """
+        Args:
+            key: A session identifier.
+            user: The user value to cache.
+
+        Returns:
+            None
+        """
+        self._data[key] = (monotonic() + self.ttl, user)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Union[str, int]) -> None:
+        """
+        Args:
+            key: A session identifier.
+
+        Returns:
+            None
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached users.
+
+        Returns:
+            None
+        """
+        self._data.clear()
 
 
 class BaseSessionAuthConfig(BaseModel):
@@ -57,20 +156,113 @@ class BaseSessionAuthConfig(BaseModel):
     """
     The value to use for the OpenAPI security scheme and security requirements
     """
+    user_cache_ttl: float = 0.0
+    """
+    Number of seconds for which a 'user' value returned by the 'retrieve_user_handler' is cached in-process.
+
+    Notes:
+    - A value of `0` disables the cache,
+    - Cached users can be invalidated using [invalidate][starlite_sessions.session_auth.BaseSessionAuthConfig.invalidate].
+    """
+    user_cache_maxsize: int = 1024
+    """
+    The maximum number of cached users. Once exceeded, the least recently used user is evicted.
+    """
+    user_cache_key: str = "id"
+    """
+    The key of the session value that identifies a cached user.
+
+    Notes:
+    - Only string and integer values are used, sessions holding any other value under this key are not cached.
+    """
+    user_cache: Optional[UserCache] = Field(default=None, exclude=True)
+    """
+    The [UserCache][starlite_sessions.session_auth.UserCache] used by the authentication middleware.
+
+    Notes:
+    - If not provided, it is created from 'user_cache_ttl', 'user_cache_maxsize' and 'user_cache_key'.
+    """
+    session_backend: Optional["BaseSessionBackend[Any]"] = Field(default=None, exclude=True)
+    """
+    The session backend shared by all middleware instances created from this config.
+
+    Notes:
+    - This value is internal, it is set on first use and cannot be passed in.
+    - Copies of the config create their own backend.
+    """
+
+    class Config(BaseConfig):
+        arbitrary_types_allowed = True
 
     @validator("retrieve_user_handler")
     def validate_retrieve_user_handler(  # pylint: disable=no-self-argument
         cls, value: RetrieveUserHandler
     ) -> Callable[[Dict[str, Any]], Awaitable[Any]]:
-        """This validator ensures that the passed in value does not get bound.
+        """This validator ensures that the passed in value can be awaited. The
+        check is done once here, so calling the handler adds no indirection for
+        async callables.
 
         Args:
             value: A callable fulfilling the RetrieveUserHandler type.
 
         Returns:
-            An instance of AsyncCallable wrapping the callable.
+            The callable if it is async, otherwise an async wrapper running it in a thread pool.
         """
-        return AsyncCallable(value)
+        if is_async_callable(value):
+            return value
+        return async_partial(value)
+
+    @validator("session_backend", pre=True)
+    def validate_session_backend(cls, value: Any) -> None:  # pylint: disable=no-self-argument
+        """This validator rejects a passed in session backend, as it is created
+        from the config on first use.
+
+        Args:
+            value: A session backend.
+
+        Raises:
+            ValueError: As 'session_backend' cannot be passed in.
+        """
+        raise ValueError("session_backend is set on first use and cannot be passed in")
+
+    @validator("exclude")
+    def validate_exclude(  # pylint: disable=no-self-argument
+        cls, value: Optional[Union[str, List[str]]]
+    ) -> Optional[List[str]]:
+        """This validator normalizes 'exclude' to a list of patterns, or `None`
+        if there are no patterns.
+
+        Args:
+            value: A pattern or list of patterns.
+
+        Returns:
+            A list of patterns or `None`.
+        """
+        if not value:
+            return None
+        return [value] if isinstance(value, str) else value
+
+    @validator("user_cache", always=True)
+    def validate_user_cache(  # pylint: disable=no-self-argument
+        cls, value: Optional[UserCache], values: Dict[str, Any]
+    ) -> Optional[UserCache]:
+        """This validator creates the user cache if it is enabled and no cache
+        instance was passed in.
+
+        Args:
+            value: An optional UserCache instance.
+            values: The values of the previously validated fields.
+
+        Returns:
+            A UserCache instance or `None` if caching is disabled.
+        """
+        if value is not None or "user_cache_maxsize" not in values or "user_cache_key" not in values:
+            return value
+        if values.get("user_cache_ttl", 0) > 0:
+            return UserCache(
+                ttl=values["user_cache_ttl"], maxsize=values["user_cache_maxsize"], key=values["user_cache_key"]
+            )
+        return value
 
     @property
     def middleware(self) -> DefineMiddleware:
@@ -110,6 +302,74 @@ class BaseSessionAuthConfig(BaseModel):
         """
         return DefineMiddleware(MiddlewareWrapper, config=self)
 
+    @property
+    def exclude_pattern(self) -> Optional[Pattern[str]]:
+        """The 'exclude' patterns compiled into a single regular expression. It
+        is created when the middleware stack is built, so it reflects the
+        current value of 'exclude'.
+
+        Returns:
+            A compiled pattern or `None` if no patterns are excluded.
+        """
+        if not self.exclude:
+            return None
+        exclude = [self.exclude] if isinstance(self.exclude, str) else self.exclude
+        return re.compile("|".join(f"(?:{pattern})" for pattern in exclude))
+
+    @property
+    def backend(self) -> "BaseSessionBackend[Any]":
+        """The session backend is created once per config, so its setup, e.g.
+        the cookie encryption key, is shared by the middleware of all routes.
+
+        Returns:
+            A [BaseSessionBackend][starlite.middleware.session.base.BaseSessionBackend] instance.
+        """
+        if self.session_backend is None:
+            self.session_backend = self.create_backend()
+        return self.session_backend
+
+    @abstractmethod
+    def create_backend(self) -> "BaseSessionBackend[Any]":  # pragma: no cover
+        """This method must be implemented by subclasses.
+
+        Returns:
+            A [BaseSessionBackend][starlite.middleware.session.base.BaseSessionBackend] instance.
+        """
+
+    def copy(self: ConfigT, *args: Any, **kwargs: Any) -> ConfigT:
+        """Copy the config, including the internal values.
+
+        [BaseModel.copy][pydantic.BaseModel.copy] drops the excluded fields, so they are set here: The copy creates
+        its own session backend on first use. A passed in user cache is shared, otherwise the copy creates its own from
+        its values.
+
+        Args:
+            *args: Positional arguments passed to [BaseModel.copy][pydantic.BaseModel.copy].
+            **kwargs: Keyword arguments passed to [BaseModel.copy][pydantic.BaseModel.copy].
+
+        Returns:
+            A copy of the config.
+        """
+        copied = super().copy(*args, **kwargs)
+        copied.session_backend = None
+        # a passed in user cache is shared, otherwise the copy creates its own from its values.
+        user_cache = self.user_cache if "user_cache" in self.__fields_set__ else None
+        copied.user_cache = copied.validate_user_cache(user_cache, copied.__dict__)
+        return copied
+
+    def invalidate(self, session_id: Union[str, int]) -> None:
+        """Remove the cached user for the given session identifier, e.g. after
+        the user has been updated or deleted.
+
+        Args:
+            session_id: The session value stored under 'user_cache_key'.
+
+        Returns:
+            None
+        """
+        if self.user_cache is not None:
+            self.user_cache.invalidate(session_id)
+
     @property
     def openapi_components(self) -> Components:
         """Creates OpenAPI documentation for the Session Authentication schema
@@ -144,32 +404,61 @@ class SessionAuth(BaseSessionAuthConfig, CookieBackendConfig):
     A pattern or list of patterns to skip in the session middleware.
     """
 
+    class Config(BaseSessionAuthConfig.Config, CookieBackendConfig.Config):
+        pass
+
+    def create_backend(self) -> "BaseSessionBackend[Any]":
+        """
+        Returns:
+            A [CookieBackend][starlite.middleware.session.cookie_backend.CookieBackend] instance.
+        """
+        warnings.warn(
+            "SessionAuth is deprecated and will be removed in a future version. use SessionAuthConfig instead.",
+            PendingDeprecationWarning,
+        )
+        return CookieBackend(config=CookieBackendConfig(**self.dict(exclude={"exclude"}), exclude=self.exclude_session))
+
 
 class SessionAuthConfig(BaseSessionAuthConfig):
     backend_config: BaseBackendConfig
 
+    def create_backend(self) -> "BaseSessionBackend[Any]":
+        """
+        Returns:
+            An instance of the backend class of 'backend_config'.
+        """
+        # '_backend_class' is the backend config's public hook for the backend it configures.
+        return self.backend_config._backend_class(config=self.backend_config)  # pylint: disable=protected-access
+
 
 class MiddlewareWrapper(MiddlewareProtocol):
+    __slots__ = ("config",)
+
     def __init__(self, app: "ASGIApp", config: Union[SessionAuth, SessionAuthConfig]):
         """This class creates a small stack of middlewares: It wraps the
-        SessionAuthMiddleware inside ExceptionHandlerMiddleware, and it wraps
-        this inside SessionMiddleware. This allows the auth middleware to raise
-        exceptions and still have the response handled, while having the
+        SessionAuthMiddleware inside SessionMiddleware. This allows the auth
+        middleware to respond to unauthenticated connections, while having the
         session cleared.
 
+        The stack is built once during instantiation, so dispatching a request
+        requires no additional checks.
+
         Args:
             app: An ASGIApp, this value is the next ASGI handler to call in the middleware stack.
             config: An instance of SessionAuth
         """
-        self.app = app
-        self.has_wrapped_middleware = False
         self.config = config
+        auth_middleware = SessionAuthMiddleware(
+            app=app,
+            exclude=config.exclude_pattern,
+            retrieve_user_handler=config.retrieve_user_handler,
+            user_cache=config.user_cache,
+        )
+        self.app = SessionMiddleware(app=auth_middleware, backend=config.backend)
 
     async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
-        """This is the entry point to the middleware. If
-        'self.had_wrapped_middleware' is False, the wrapper will update the
-        value of 'self.app' to be the middleware stack described in the
-        __init__ method. Otherwise, it will call the next ASGI handler.
+        """This is the entry point to the middleware. It calls the middleware
+        stack described in the __init__ method.
 
         Args:
             scope: The ASGI connection scope.
@@ -179,80 +468,190 @@ class MiddlewareWrapper(MiddlewareProtocol):
         Returns:
             None
         """
-        if not self.has_wrapped_middleware:
-            starlite_app = scope["app"]
-            auth_middleware = SessionAuthMiddleware(
-                app=self.app,
-                exclude=self.config.exclude,
-                retrieve_user_handler=cast(
-                    "Callable[[Dict[str, Any]], Awaitable[Any]]", self.config.retrieve_user_handler
-                ),
-            )
-            exception_middleware = ExceptionHandlerMiddleware(
-                app=auth_middleware,
-                exception_handlers=starlite_app.exception_handlers or {},
-                debug=starlite_app.debug,
-            )
-            backend: "BaseSessionBackend[Any]"
-            if isinstance(self.config, SessionAuth):
-                warnings.warn(
-                    "SessionAuth is deprecated and will be removed in a future version."
-                    " use SessionAuthConfig instead.",
-                    PendingDeprecationWarning,
-                )
-                new_config = CookieBackendConfig(
-                    **self.config.dict(exclude={"exclude"}), exclude=self.config.exclude_session
-                )
-                backend = CookieBackend(config=new_config)
-            else:
-                backend = self.config.backend_config._backend_class(config=self.config.backend_config)
-            self.app = SessionMiddleware(app=exception_middleware, backend=backend)
-            self.has_wrapped_middleware = True
         await self.app(scope, receive, send)
 
 
-class SessionAuthMiddleware(AbstractAuthenticationMiddleware):
+class SessionAuthMiddleware(MiddlewareProtocol):
+    __slots__ = (
+        "exclude",
+        "retrieve_user_handler",
+        "unauthorized_responses",
+        "user_cache",
+    )
+
+    scopes = {ScopeType.HTTP, ScopeType.WEBSOCKET}
+    """
+    Scopes supported by the middleware.
+    """
+    exclude_from_auth_key = "exclude_from_auth"
+    """
+    An identifier to use on routes to disable authentication for a particular route.
+    """
+
     def __init__(
         self,
         app: "ASGIApp",
-        exclude: Optional[Union[str, List[str]]],
+        exclude: Optional[Pattern[str]],
         retrieve_user_handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+        user_cache: Optional[UserCache] = None,
     ):
         """A Starlite Authentication Middleware that uses session cookies.
 
+        This is a pure ASGI middleware: it reads the session directly from the
+        connection scope and responds to unauthenticated connections itself,
+        without creating a connection object or raising an exception.
+
         Args:
             app: An ASGIApp, this value is the next ASGI handler to call in the middleware stack.
-            exclude: A pattern or list of patterns to skip in the authentication middleware.
+            exclude: A compiled pattern of paths to skip in the authentication middleware.
             retrieve_user_handler: A callable that receives the session dictionary after it has been decoded and returns
                 a 'user' value.
+            user_cache: An optional [UserCache][starlite_sessions.session_auth.UserCache] used to skip the
+                'retrieve_user_handler' for recently authenticated sessions.
         """
-        super().__init__(app=app, exclude=exclude)
+        self.app = app
+        self.user_cache = user_cache
+        self.exclude = exclude
         self.retrieve_user_handler = retrieve_user_handler
+        self.unauthorized_responses: Dict[str, Tuple[List[Tuple[bytes, bytes]], bytes]] = {}
+        for detail in (NO_SESSION_DETAIL, NO_USER_DETAIL):
+            response = create_exception_response(NotAuthorizedException(detail))
+            self.unauthorized_responses[detail] = (response.encoded_headers, response.body)
 
-    async def authenticate_request(self, connection: "ASGIConnection[Any, Any, Any]") -> AuthenticationResult:
-        """Implementation of the authentication method specified by Starlite's.
-
-        [AbstractAuthenticationMiddleware][starlite.middleware.authentication.AbstractAuthenticationMiddleware].
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        """Authenticate the connection using the session data in 'scope'. If
+        successful, 'scope["user"]' and 'scope["auth"]' are set and the next
+        ASGI handler is called. Otherwise, the session is cleared and a 401
+        response is sent.
 
         Args:
-            connection: A Starlette 'HTTPConnection' instance.
+            scope: The ASGI connection scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
 
         Raises:
-            [NotAuthorizedException][starlite.exceptions.NotAuthorizedException]: if session data is empty or user
-                is not found.
+            [ImproperlyConfiguredException][starlite.exceptions.ImproperlyConfiguredException]: if 'session' is not
+                set in scope.
 
         Returns:
-            [AuthenticationResult][starlite.middleware.authentication.AuthenticationResult]
+            None
         """
-        if not connection.session or connection.session is Empty:  # type: ignore
-            # the assignment of 'Empty' forces the session middleware to clear session data.
-            connection.scope["session"] = Empty
-            raise NotAuthorizedException("no session data found")
-
-        user = await self.retrieve_user_handler(connection.session)
+        if should_bypass_middleware(
+            scope=scope,
+            scopes=self.scopes,
+            exclude_opt_key=self.exclude_from_auth_key,
+            exclude_path_pattern=self.exclude,
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            session = scope["session"]
+        except KeyError as e:
+            raise ImproperlyConfiguredException(
+                "'session' is not defined in scope, install a SessionMiddleware to set it"
+            ) from e
+
+        if session is Empty or not session:
+            await self.send_unauthorized(scope, receive, send, NO_SESSION_DETAIL)
+            return
+
+        user = None
+        cache_key = None
+        user_cache = self.user_cache
+        if user_cache is not None:
+            cache_key = user_cache.get_session_id(session)  # type: ignore[arg-type]
+            if cache_key is not None:
+                user = user_cache.get(cache_key)
+
+        if user is None:
+            try:
+                user = await self.retrieve_user_handler(session)  # type: ignore[arg-type]
+            except Exception as e:  # pylint: disable=broad-except
+                await handle_exception(e, scope, receive, send)
+                return
+            if user and user_cache is not None and cache_key is not None:
+                user_cache.set(cache_key, user)
 
         if not user:
-            connection.scope["session"] = Empty
-            raise NotAuthorizedException("no user correlating to session found")
+            await self.send_unauthorized(scope, receive, send, NO_USER_DETAIL)
+            return
+
+        scope["user"] = user
+        scope["auth"] = session
+        await self.app(scope, receive, send)
+
+    async def send_unauthorized(self, scope: "Scope", receive: "Receive", send: "Send", detail: str) -> None:
+        """Clear the session and reject the connection.
+
+        The connection is rejected with a [NotAuthorizedException][starlite.exceptions.NotAuthorizedException]. HTTP
+        connections receive the 401 response pre-rendered during instantiation, unless the app registers an exception
+        handler for it.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+            detail: The exception detail.
 
-        return AuthenticationResult(user=user, auth=connection.session)
+        Returns:
+            None
+        """
+        # the assignment of 'Empty' forces the session middleware to clear session data.
+        scope["session"] = Empty
+        exc = NotAuthorizedException(detail)
+        starlite_app = scope["app"]
+        if scope["type"] != ScopeType.HTTP or get_exception_handler(starlite_app.exception_handlers, exc):
+            await handle_exception(exc, scope, receive, send)
+            return
+
+        for hook in starlite_app.after_exception:
+            await hook(exc, scope, starlite_app.state)
+        headers, body = self.unauthorized_responses[detail]
+        # the headers are copied, since the session middleware appends its cookies to the list.
+        start_event: "HTTPResponseStartEvent" = {
+            "type": "http.response.start",
+            "status": HTTP_401_UNAUTHORIZED,
+            "headers": list(headers),
+        }
+        body_event: "HTTPResponseBodyEvent" = {"type": "http.response.body", "body": body, "more_body": False}
+        await send(start_event)
+        await send(body_event)
+
+
+async def handle_exception(exc: Exception, scope: "Scope", receive: "Receive", send: "Send") -> None:
+    """Respond to an exception raised while authenticating.
+
+    The exception is handed over to an [ExceptionHandlerMiddleware][starlite.middleware.ExceptionHandlerMiddleware]
+    using the app's exception handlers and 'debug' flag. Responding here, rather than letting the exception propagate,
+    keeps the response within the session middleware, so the session cookie is still handled.
+
+    Args:
+        exc: The exception to respond to.
+        scope: The ASGI connection scope.
+        receive: The ASGI receive function.
+        send: The ASGI send function.
+
+    Returns:
+        None
+    """
+    starlite_app = scope["app"]
+    exception_middleware = ExceptionHandlerMiddleware(
+        app=partial(_raise, exc),
+        exception_handlers=starlite_app.exception_handlers or {},
+        debug=starlite_app.debug,
+    )
+    await exception_middleware(scope, receive, send)
+
+
+async def _raise(exc: Exception, *_: Any) -> None:
+    """Re-raise 'exc', used to hand it over to an 'ExceptionHandlerMiddleware'.
+
+    Args:
+        exc: The exception to raise.
+        *_: The ASGI scope, receive and send arguments.
+
+    Raises:
+        exc
+    """
+    raise exc
@@ -1,20 +1,35 @@
 from os import urandom
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
 import pytest
-from pydantic import BaseModel, SecretBytes
+from pydantic import BaseModel, SecretBytes, ValidationError
 from starlette.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
     HTTP_401_UNAUTHORIZED,
+    HTTP_404_NOT_FOUND,
 )
-from starlite import OpenAPIConfig, Request, Starlite, delete, get, post
+from starlite import (
+    NotAuthorizedException,
+    NotFoundException,
+    OpenAPIConfig,
+    Request,
+    Response,
+    Starlite,
+    WebSocket,
+    delete,
+    get,
+    post,
+    websocket,
+)
+from starlite.exceptions import WebSocketDisconnect
 from starlite.middleware.session.memory_backend import MemoryBackendConfig
 from starlite.testing import create_test_client
 
 from starlite_sessions import SessionAuth, SessionAuthConfig
+from starlite_sessions.session_auth import UserCache
 
 
 class User(BaseModel):
@@ -32,6 +47,10 @@ def retrieve_user_handler(session_data: Dict[str, Any]) -> Optional[User]:
     return None
 
 
+async def async_retrieve_user_handler(session_data: Dict[str, Any]) -> Optional[User]:
+    return retrieve_user_handler(session_data)
+
+
 @pytest.mark.parametrize(
     "session_auth",
     [
@@ -39,6 +58,9 @@ def retrieve_user_handler(session_data: Dict[str, Any]) -> Optional[User]:
         SessionAuthConfig(
             retrieve_user_handler=retrieve_user_handler, exclude=["login"], backend_config=MemoryBackendConfig()
         ),
+        SessionAuthConfig(
+            retrieve_user_handler=async_retrieve_user_handler, exclude=["login"], backend_config=MemoryBackendConfig()
+        ),
     ],
 )
 def test_authentication(session_auth: Union[SessionAuth, SessionAuthConfig]) -> None:
@@ -83,6 +105,303 @@ def test_authentication(session_auth: Union[SessionAuth, SessionAuthConfig]) ->
         assert response.status_code == HTTP_401_UNAUTHORIZED
 
 
+def test_authentication_websocket() -> None:
+    session_auth = SessionAuthConfig(
+        retrieve_user_handler=retrieve_user_handler, exclude=["login"], backend_config=MemoryBackendConfig()
+    )
+
+    @post("/login")
+    def login_handler(request: Request[Any, Any], data: Dict[str, Any]) -> None:
+        request.set_session(data)
+
+    @websocket("/ws")
+    async def websocket_handler(socket: WebSocket[User, Any]) -> None:
+        await socket.accept()
+        await socket.send_json(socket.user.dict())
+        await socket.close()
+
+    with create_test_client(
+        route_handlers=[login_handler, websocket_handler], middleware=[session_auth.middleware]
+    ) as client:
+        with pytest.raises(WebSocketDisconnect) as exc_info, client.websocket_connect("/ws"):
+            pass
+        assert exc_info.value.code == 4401
+
+        client.post("/login", json=user_instance.dict())
+        with client.websocket_connect("/ws") as ws:
+            assert ws.receive_json() == user_instance.dict()
+
+
+def test_authentication_exception_handler() -> None:
+    session_auth = SessionAuthConfig(retrieve_user_handler=retrieve_user_handler, backend_config=MemoryBackendConfig())
+
+    def exception_handler(_: Request[Any, Any], exc: NotAuthorizedException) -> Response[str]:
+        return Response(content=f"custom: {exc.detail}", status_code=exc.status_code, media_type="text/plain")
+
+    @get("/user")
+    def get_user_handler(request: Request[User, Any]) -> User:
+        return request.user
+
+    with create_test_client(
+        route_handlers=[get_user_handler],
+        middleware=[session_auth.middleware],
+        exception_handlers={NotAuthorizedException: exception_handler},
+    ) as client:
+        response = client.get("/user")
+        assert response.status_code == HTTP_401_UNAUTHORIZED
+        assert response.text == "custom: no session data found"
+
+
+def test_retrieve_user_handler_exception() -> None:
+    def raising_retrieve_user_handler(session_data: Dict[str, Any]) -> Optional[User]:
+        raise NotFoundException("user lookup failed")
+
+    session_auth = SessionAuth(
+        secret=SecretBytes(urandom(16)), exclude=["login"], retrieve_user_handler=raising_retrieve_user_handler
+    )
+
+    @post("/login")
+    def login_handler(request: Request[Any, Any], data: Dict[str, Any]) -> None:
+        request.set_session(data)
+
+    @get("/user")
+    def get_user_handler(request: Request[User, Any]) -> User:
+        return request.user
+
+    with create_test_client(
+        route_handlers=[login_handler, get_user_handler], middleware=[session_auth.middleware]
+    ) as client:
+        client.post("/login", json=user_instance.dict())
+        response = client.get("/user")
+        assert response.status_code == HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == "user lookup failed"
+        # the response is still sent through the session middleware, which sets the session cookie.
+        assert "session-0=" in response.headers["set-cookie"]
+
+
+def test_user_cache() -> None:
+    calls = []
+
+    def counting_retrieve_user_handler(session_data: Dict[str, Any]) -> Optional[User]:
+        calls.append(session_data["id"])
+        return retrieve_user_handler(session_data)
+
+    session_auth = SessionAuthConfig(
+        retrieve_user_handler=counting_retrieve_user_handler,
+        exclude=["login"],
+        backend_config=MemoryBackendConfig(),
+        user_cache_ttl=60,
+    )
+
+    @post("/login")
+    def login_handler(request: Request[Any, Any], data: Dict[str, Any]) -> None:
+        request.set_session(data)
+
+    @get("/user")
+    def get_user_handler(request: Request[User, Any]) -> User:
+        return request.user
+
+    with create_test_client(
+        route_handlers=[login_handler, get_user_handler], middleware=[session_auth.middleware]
+    ) as client:
+        client.post("/login", json=user_instance.dict())
+        for _ in range(3):
+            response = client.get("/user")
+            assert response.status_code == HTTP_200_OK
+            assert response.json() == user_instance.dict()
+        assert calls == [user_instance.id]
+
+        session_auth.invalidate(user_instance.id)
+        assert client.get("/user").status_code == HTTP_200_OK
+        assert calls == [user_instance.id, user_instance.id]
+
+
+def test_user_cache_config() -> None:
+    session_auth = SessionAuth(
+        secret=SecretBytes(urandom(16)), retrieve_user_handler=retrieve_user_handler, user_cache_ttl=60
+    )
+    copied = session_auth.copy()
+    assert copied.user_cache is not None
+    assert copied.user_cache is not session_auth.user_cache
+    assert session_auth.copy(update={"user_cache_ttl": 0}).user_cache is None
+
+    user_cache = UserCache(ttl=60, maxsize=2)
+    session_auth = SessionAuth(
+        secret=SecretBytes(urandom(16)), retrieve_user_handler=retrieve_user_handler, user_cache=user_cache
+    )
+    assert session_auth.copy().user_cache is user_cache
+
+    with pytest.raises(ValidationError):
+        SessionAuth(
+            secret=SecretBytes(urandom(16)),
+            retrieve_user_handler=retrieve_user_handler,
+            user_cache_ttl=60,
+            user_cache_maxsize="abc",  # type: ignore[arg-type]
+        )
+
+
+def test_user_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("starlite_sessions.session_auth.monotonic", lambda: now)
+    user_cache = UserCache(ttl=10, maxsize=2)
+    user_cache.set("a", user_instance)
+
+    now = 110.0
+    assert user_cache.get("a") is user_instance
+
+    now = 110.1
+    assert user_cache.get("a") is None
+    assert user_cache.get("missing") is None
+
+
+def test_user_cache_eviction() -> None:
+    user_cache = UserCache(ttl=60, maxsize=1)
+    user_cache.set("a", "user-a")
+    user_cache.set("b", "user-b")
+    assert user_cache.get("a") is None
+    assert user_cache.get("b") == "user-b"
+
+    user_cache = UserCache(ttl=60, maxsize=2)
+    user_cache.set("a", "user-a")
+    user_cache.set("b", "user-b")
+    # reading 'a' makes 'b' the least recently used entry
+    assert user_cache.get("a") == "user-a"
+    user_cache.set("c", "user-c")
+    assert user_cache.get("b") is None
+    assert user_cache.get("a") == "user-a"
+    assert user_cache.get("c") == "user-c"
+
+
+@pytest.mark.parametrize(
+    "session, expected",
+    [
+        ({"id": "abc"}, "abc"),
+        ({"id": 1}, 1),
+        ({"id": True}, None),
+        ({"id": ["abc"]}, None),
+        ({"id": {"abc": 1}}, None),
+        ({}, None),
+    ],
+)
+def test_user_cache_session_id(session: Dict[str, Any], expected: Any) -> None:
+    assert UserCache(ttl=60, maxsize=2).get_session_id(session) == expected
+
+
+def test_user_cache_unhashable_session_id() -> None:
+    session_auth = SessionAuthConfig(
+        retrieve_user_handler=lambda session: session["name"],
+        exclude=["login"],
+        backend_config=MemoryBackendConfig(),
+        user_cache_ttl=60,
+    )
+
+    @post("/login")
+    def login_handler(request: Request[Any, Any], data: Dict[str, Any]) -> None:
+        request.set_session(data)
+
+    @get("/user")
+    def get_user_handler(request: Request[str, Any]) -> str:
+        return request.user
+
+    with create_test_client(
+        route_handlers=[login_handler, get_user_handler], middleware=[session_auth.middleware]
+    ) as client:
+        client.post("/login", json={"id": ["abc"], "name": "Moishe"})
+        response = client.get("/user")
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "Moishe"
+
+
+@pytest.mark.parametrize(
+    "exclude, expected_exclude, expected_pattern",
+    [
+        (None, None, None),
+        ([], None, None),
+        ("login", ["login"], "(?:login)"),
+        (["login", "signup"], ["login", "signup"], "(?:login)|(?:signup)"),
+    ],
+)
+def test_exclude(
+    exclude: Union[str, List[str], None], expected_exclude: Optional[List[str]], expected_pattern: Optional[str]
+) -> None:
+    session_auth = SessionAuthConfig(
+        retrieve_user_handler=retrieve_user_handler, exclude=exclude, backend_config=MemoryBackendConfig()
+    )
+    assert session_auth.exclude == expected_exclude
+    assert (session_auth.exclude_pattern.pattern if session_auth.exclude_pattern else None) == expected_pattern
+
+
+def test_exclude_copy() -> None:
+    session_auth = SessionAuthConfig(
+        retrieve_user_handler=retrieve_user_handler, exclude=["login"], backend_config=MemoryBackendConfig()
+    )
+    copied = session_auth.copy()
+    copied.exclude = ["signup"]
+
+    @get("/login")
+    def login_handler() -> None:
+        return None
+
+    @get("/signup")
+    def signup_handler() -> None:
+        return None
+
+    with create_test_client(route_handlers=[login_handler, signup_handler], middleware=[copied.middleware]) as client:
+        assert client.get("/login").status_code == HTTP_401_UNAUTHORIZED
+        assert client.get("/signup").status_code == HTTP_200_OK
+
+
+def test_session_backend() -> None:
+    session_auth = SessionAuthConfig(
+        retrieve_user_handler=retrieve_user_handler, exclude=["login"], backend_config=MemoryBackendConfig()
+    )
+    backend = session_auth.backend
+    assert session_auth.backend is backend
+
+    copied = session_auth.copy(update={"backend_config": MemoryBackendConfig(max_age=60)})
+    assert copied.backend is not backend
+    assert copied.backend.config.max_age == 60
+
+    @post("/login")
+    def login_handler(request: Request[Any, Any], data: Dict[str, Any]) -> None:
+        request.set_session(data)
+
+    @get("/user")
+    def get_user_handler(request: Request[User, Any]) -> User:
+        return request.user
+
+    with create_test_client(route_handlers=[login_handler, get_user_handler], middleware=[copied.middleware]) as client:
+        assert client.get("/user").status_code == HTTP_401_UNAUTHORIZED
+        response = client.post("/login", json=user_instance.dict())
+        assert response.status_code == HTTP_201_CREATED
+        assert "Max-Age=60" in response.headers["set-cookie"]
+        response = client.get("/user")
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == user_instance.dict()
+
+    with pytest.raises(ValidationError):
+        SessionAuthConfig(
+            retrieve_user_handler=retrieve_user_handler,
+            backend_config=MemoryBackendConfig(),
+            session_backend=backend,
+        )
+
+
+def test_openapi_components_not_shared() -> None:
+    first = SessionAuthConfig(retrieve_user_handler=retrieve_user_handler, backend_config=MemoryBackendConfig())
+    second = SessionAuthConfig(retrieve_user_handler=retrieve_user_handler, backend_config=MemoryBackendConfig())
+
+    components = first.openapi_components
+    components.securitySchemes["other"] = components.securitySchemes["sessionCookie"]  # type: ignore[index]
+    components.securitySchemes["sessionCookie"].description = "changed"  # type: ignore[index]
+
+    for session_auth in (first, second):
+        security_schemes = session_auth.openapi_components.securitySchemes
+        assert security_schemes is not None
+        assert list(security_schemes) == ["sessionCookie"]
+        assert security_schemes["sessionCookie"].description == "Session cookie authentication."
+
+
 def test_openapi() -> None:
     def retrieve_user_handler(session_data: Dict[str, Any]) -> Optional[User]:
         return None